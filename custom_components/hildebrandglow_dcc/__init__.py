@@ -1,17 +1,19 @@
 """The Hildebrand Glow (DCC) integration."""
 from __future__ import annotations
 
+import asyncio
 import logging
 
-from glowmarkt import BrightClient
+import async_timeout
 import requests
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant
-from homeassistant.exceptions import ConfigEntryNotReady
+from homeassistant.exceptions import ConfigEntryAuthFailed, ConfigEntryNotReady
 
-from .const import DOMAIN
+from .api import GlowClient, InvalidAuth, TokenRefresher
+from .const import AUTH_TIMEOUT, DOMAIN
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -23,20 +25,30 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     hass.data.setdefault(DOMAIN, {})
     # Authenticate with the API
     try:
-        glowmarkt = await hass.async_add_executor_job(
-            BrightClient, entry.data["username"], entry.data["password"]
-        )
-    except requests.Timeout as ex:
+        # Each request times out in the client, which frees the executor thread,
+        # while this bounds the login as a whole
+        async with async_timeout.timeout(AUTH_TIMEOUT):
+            glowmarkt = await hass.async_add_executor_job(
+                GlowClient, entry.data["username"], entry.data["password"]
+            )
+    except (asyncio.TimeoutError, requests.Timeout) as ex:
         raise ConfigEntryNotReady(f"Timeout: {ex}") from ex
     except requests.exceptions.ConnectionError as ex:
         raise ConfigEntryNotReady(f"Cannot connect: {ex}") from ex
+    # Let Home Assistant start a reauth flow rather than retrying bad credentials
+    except InvalidAuth as ex:
+        raise ConfigEntryAuthFailed(f"Authentication failed: {ex}") from ex
+    # Can't use the RuntimeError exception from the library as it's not a subclass of Exception
     except Exception as ex:  # pylint: disable=broad-except
         raise ConfigEntryNotReady(f"Unexpected exception: {ex}") from ex
     else:
         _LOGGER.debug("Successful Post to %sauth", glowmarkt.url)
 
-    # Set API object
-    hass.data[DOMAIN][entry.entry_id] = glowmarkt
+    # Set API object, along with the state needed to keep its token fresh
+    refresher = TokenRefresher(hass, glowmarkt)
+    hass.data[DOMAIN][entry.entry_id] = refresher
+    # Keep the token fresh even when no sensor is polling
+    refresher.async_schedule(entry)
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
@@ -0,0 +1,244 @@
+"""Client for the Hildebrand Glow API."""
+from __future__ import annotations
+
+import asyncio
+import base64
+from datetime import datetime
+from functools import lru_cache
+from http import HTTPStatus
+import json
+import logging
+import random
+
+from glowmarkt import BrightClient
+import requests
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.exceptions import ConfigEntryAuthFailed, HomeAssistantError
+from homeassistant.helpers.event import async_track_point_in_utc_time
+from homeassistant.util import dt as dt_util
+
+from .const import REQUEST_TIMEOUT
+
+_LOGGER = logging.getLogger(__name__)
+
+# Application ID of the Bright app, which pyglowmarkt uses for every request
+APPLICATION_ID = "b0f1b774-a586-4f72-9edd-27ead8aa7a8d"
+API_URL = "https://api.glowmarkt.com/api/v0-1/"
+
+# Refresh the API token this many seconds before it expires
+TOKEN_REFRESH_MARGIN = 300
+# Spread background token refreshes over this many seconds
+TOKEN_REFRESH_JITTER = 60
+
+# Base and maximum delay in seconds between failed token refreshes
+TOKEN_BACKOFF_BASE = 30
+TOKEN_BACKOFF_MAX = 1800
+
+# Status codes the auth endpoint may use to reject the username or password
+AUTH_REJECTED_STATUSES = frozenset(
+    {HTTPStatus.BAD_REQUEST, HTTPStatus.UNAUTHORIZED, HTTPStatus.FORBIDDEN}
+)
+
+
+class InvalidAuth(HomeAssistantError):
+    """Error to indicate the API rejected the username or password."""
+
+
+class TimeoutSession(requests.Session):
+    """Session that applies a default timeout to every request."""
+
+    def request(self, *args, **kwargs):
+        """Send a request, giving up if the API stops responding."""
+        kwargs.setdefault("timeout", REQUEST_TIMEOUT)
+        return super().request(*args, **kwargs)
+
+
+class GlowClient(BrightClient):
+    """BrightClient whose requests time out instead of blocking forever.
+
+    pyglowmarkt doesn't set a timeout on its requests, so a hung connection
+    would hold an executor thread until Home Assistant is restarted.
+    """
+
+    def __init__(  # pylint: disable=super-init-not-called
+        self, username: str, password: str
+    ) -> None:
+        """Authenticate with the API.
+
+        BrightClient.__init__ authenticates straight away with its own session,
+        so the same attributes are set up here around a TimeoutSession instead.
+        """
+        self.username = username
+        self.password = password
+        self.application = APPLICATION_ID
+        self.url = API_URL
+        self.session = TimeoutSession()
+
+        self.token = self.authenticate()
+
+    def authenticate(self) -> str:
+        """Get an API token, telling rejected credentials apart from outages.
+
+        pyglowmarkt raises the same error for any non-200 response, so a
+        Glow outage would look like a wrong password.
+        """
+        headers = {
+            "Content-Type": "application/json",
+            "applicationId": self.application,
+        }
+        data = {"username": self.username, "password": self.password}
+
+        resp = self.session.post(
+            f"{self.url}auth", headers=headers, data=json.dumps(data)
+        )
+
+        if resp.status_code in AUTH_REJECTED_STATUSES:
+            raise InvalidAuth("Authentication failed")
+        if resp.status_code != HTTPStatus.OK:
+            raise RuntimeError("Request failed")
+
+        resp = resp.json()
+
+        if resp["valid"] is False:
+            raise InvalidAuth("Expected an authentication token")
+        if "token" not in resp:
+            raise RuntimeError("Expected an authentication token")
+
+        return resp["token"]
+
+
+def log_request_error(
+    logger: logging.Logger, ex: Exception, warn: bool = False
+) -> None:
+    """Log an exception raised by a request to the API to the caller's logger.
+
+    Non-200 responses are only logged as a warning when warn is set, as
+    they're expected to clear up by the next poll.
+    """
+    if isinstance(ex, requests.Timeout):
+        logger.error("Timeout: %s", ex)
+    elif isinstance(ex, requests.exceptions.ConnectionError):
+        logger.error("Cannot connect: %s", ex)
+    elif "Request failed" in str(ex):
+        log = logger.warning if warn else logger.error
+        log("Non-200 Status Code. The Glow API may be experiencing issues")
+    else:
+        logger.error("Unexpected exception: %s. Please open an issue", ex, exc_info=ex)
+
+
+@lru_cache(maxsize=8)
+def token_expiry(token: str) -> float:
+    """Return when an API token expires, from the exp claim of the JWT."""
+    try:
+        payload = token.split(".")[1]
+        # JWTs are base64 encoded without padding
+        claims = json.loads(
+            base64.urlsafe_b64decode(payload + "=" * (-len(payload) % 4))
+        )
+        return float(claims["exp"])
+    except (IndexError, KeyError, TypeError, ValueError):
+        _LOGGER.debug("Couldn't read the expiry time of the API token")
+        return float("inf")
+
+
+def backoff_delay(attempt: int) -> float:
+    """Return a capped exponential backoff delay with jitter."""
+    delay = min(TOKEN_BACKOFF_MAX, TOKEN_BACKOFF_BASE * 2**attempt)
+    # Jitter stops every installation retrying at the same moment
+    return delay + random.uniform(0, delay / 2)
+
+
+class TokenRefresher:
+    """Keeps the API token of a config entry's client fresh."""
+
+    def __init__(self, hass: HomeAssistant, client: GlowClient) -> None:
+        """Initialize the token refresher."""
+        self.hass = hass
+        self.client = client
+
+        # Concurrent updates share a single refresh
+        self._lock = asyncio.Lock()
+        # Number of failed refreshes in a row and when to try again
+        self._attempt = 0
+        self._retry_after = 0.0
+
+    def expiring(self) -> bool:
+        """Check if the API token is about to expire."""
+        return (
+            datetime.now().timestamp()
+            > token_expiry(self.client.token) - TOKEN_REFRESH_MARGIN
+        )
+
+    async def async_refresh(self, logger: logging.Logger = _LOGGER) -> None:
+        """Authenticate with the API again if the token is about to expire.
+
+        Failures are logged to the given logger, so errors during sensor updates
+        show up under the sensor platform.
+        """
+        if not self.expiring():
+            return
+
+        async with self._lock:
+            # Another update may have refreshed the token while we were waiting
+            if not self.expiring():
+                return
+            # Don't hammer the API while it is failing
+            now = datetime.now().timestamp()
+            if now < self._retry_after:
+                return
+            try:
+                self.client.token = await self.hass.async_add_executor_job(
+                    self.client.authenticate
+                )
+            except InvalidAuth as ex:
+                raise ConfigEntryAuthFailed(f"Authentication failed: {ex}") from ex
+            # Can't use the RuntimeError exception from the library as it's not a subclass of Exception
+            except Exception as ex:  # pylint: disable=broad-except
+                log_request_error(logger, ex)
+            else:
+                _LOGGER.debug("Successful Post to %sauth", self.client.url)
+                self._attempt = 0
+                self._retry_after = 0.0
+                return
+            self._retry_after = now + backoff_delay(self._attempt)
+            self._attempt += 1
+
+    @callback
+    def async_schedule(self, entry: ConfigEntry) -> None:
+        """Refresh the API token in the background shortly before it expires."""
+        cancel_refresh: CALLBACK_TYPE | None = None
+
+        @callback
+        def schedule_refresh() -> None:
+            nonlocal cancel_refresh
+            cancel_refresh = None
+            expiry = token_expiry(self.client.token)
+            if expiry == float("inf"):
+                return
+            # Jitter stops every installation logging in at the same moment
+            when = (
+                expiry - TOKEN_REFRESH_MARGIN + random.uniform(0, TOKEN_REFRESH_JITTER)
+            )
+            # Respect the backoff if the last refresh failed
+            when = max(when, self._retry_after)
+            cancel_refresh = async_track_point_in_utc_time(
+                self.hass, refresh, dt_util.utc_from_timestamp(when)
+            )
+
+        async def refresh(_now: datetime) -> None:
+            try:
+                await self.async_refresh()
+            except ConfigEntryAuthFailed:
+                entry.async_start_reauth(self.hass)
+                return
+            schedule_refresh()
+
+        @callback
+        def cancel() -> None:
+            if cancel_refresh is not None:
+                cancel_refresh()
+
+        schedule_refresh()
+        entry.async_on_unload(cancel)
@@ -1,10 +1,12 @@
 """Config flow for Hildebrand Glow (DCC) integration."""
 from __future__ import annotations
 
+import asyncio
+from collections.abc import Mapping
 import logging
 from typing import Any
 
-from glowmarkt import BrightClient
+import async_timeout
 import requests
 import voluptuous as vol
 
@@ -12,7 +14,8 @@ from homeassistant import config_entries
 from homeassistant.core import HomeAssistant
 from homeassistant.data_entry_flow import FlowResult
 
-from .const import DOMAIN
+from .api import GlowClient, InvalidAuth
+from .const import AUTH_TIMEOUT, DOMAIN
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -23,26 +26,67 @@ STEP_USER_DATA_SCHEMA = vol.Schema(
     }
 )
 
+STEP_REAUTH_DATA_SCHEMA = vol.Schema(
+    {
+        vol.Required("password"): str,
+    }
+)
+
 
 async def validate_input(hass: HomeAssistant, data: dict[str, Any]) -> dict[str, Any]:
     """Validate the user input allows us to connect.
 
     Data has the keys from STEP_USER_DATA_SCHEMA with values provided by the user.
     """
-    glowmarkt = await hass.async_add_executor_job(
-        BrightClient, data["username"], data["password"]
-    )
+    async with async_timeout.timeout(AUTH_TIMEOUT):
+        glowmarkt = await hass.async_add_executor_job(
+            GlowClient, data["username"], data["password"]
+        )
     _LOGGER.debug("Successful Post to %sauth", glowmarkt.url)
 
     # Return title of the entry to be added
     return {"title": "Hildebrand Glow (DCC)"}
 
 
+async def try_validate_input(
+    hass: HomeAssistant, data: dict[str, Any]
+) -> tuple[dict[str, Any] | None, dict[str, str]]:
+    """Validate the user input, returning the entry info or the form errors."""
+    errors: dict[str, str] = {}
+
+    # Test authenticating with the API
+    try:
+        info = await validate_input(hass, data)
+    except (asyncio.TimeoutError, requests.Timeout) as ex:
+        _LOGGER.debug("Timeout: %s", ex)
+        errors["base"] = "timeout_connect"
+    except requests.exceptions.ConnectionError as ex:
+        _LOGGER.debug("Cannot connect: %s", ex)
+        errors["base"] = "cannot_connect"
+    except InvalidAuth as ex:
+        _LOGGER.debug("Authentication failed: %s", ex)
+        errors["base"] = "invalid_auth"
+    # Can't use the RuntimeError exception from the library as it's not a subclass of Exception
+    except Exception as ex:  # pylint: disable=broad-except
+        if "Request failed" in str(ex):
+            _LOGGER.debug("Non-200 Status Code: %s", ex)
+            errors["base"] = "cannot_connect"
+        else:
+            _LOGGER.exception("Unexpected exception: %s", ex)
+            errors["base"] = "unknown"
+    else:
+        return info, errors
+
+    return None, errors
+
+
 class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     """Handle a config flow for Hildebrand Glow (DCC)."""
 
     VERSION = 1
 
+    _reauth_entry: config_entries.ConfigEntry | None = None
+
     async def async_step_user(
         self, user_input: dict[str, Any] | None = None
     ) -> FlowResult:
@@ -53,31 +97,44 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 step_id="user", data_schema=STEP_USER_DATA_SCHEMA
             )
 
-        errors = {}
-
-        # Test authenticating with the API
-        try:
-            info = await validate_input(self.hass, user_input)
-        except requests.Timeout as ex:
-            _LOGGER.debug("Timeout: %s", ex)
-            errors["base"] = "timeout_connect"
-        except requests.exceptions.ConnectionError as ex:
-            _LOGGER.debug("Cannot connect: %s", ex)
-            errors["base"] = "cannot_connect"
-        # Can't use the RuntimeError exception from the library as it's not a subclass of Exception
-        except Exception as ex:  # pylint: disable=broad-except
-            if "Authentication failed" in str(ex):
-                _LOGGER.debug("Authentication Failed")
-                errors["base"] = "invalid_auth"
-            elif "Expected an authentication token" in str(ex):
-                _LOGGER.debug("Expected an authentication token but didn't get one")
-                errors["base"] = "invalid_auth"
-            else:
-                _LOGGER.exception("Unexpected exception: %s", ex)
-                errors["base"] = "unknown"
-        else:
+        info, errors = await try_validate_input(self.hass, user_input)
+        if info is not None:
             return self.async_create_entry(title=info["title"], data=user_input)
 
         return self.async_show_form(
             step_id="user", data_schema=STEP_USER_DATA_SCHEMA, errors=errors
         )
+
+    async def async_step_reauth(self, entry_data: Mapping[str, Any]) -> FlowResult:
+        """Handle the API rejecting the stored credentials."""
+        self._reauth_entry = self.hass.config_entries.async_get_entry(
+            self.context["entry_id"]
+        )
+        return await self.async_step_reauth_confirm()
+
+    async def async_step_reauth_confirm(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Ask for the new password of the existing account."""
+        assert self._reauth_entry is not None
+        errors: dict[str, str] = {}
+
+        if user_input is not None:
+            data = {**self._reauth_entry.data, **user_input}
+            info, errors = await try_validate_input(self.hass, data)
+            if info is not None:
+                # async_update_reload_and_abort needs a newer Home Assistant than we support
+                self.hass.config_entries.async_update_entry(
+                    self._reauth_entry, data=data
+                )
+                self.hass.async_create_task(
+                    self.hass.config_entries.async_reload(self._reauth_entry.entry_id)
+                )
+                return self.async_abort(reason="reauth_successful")
+
+        return self.async_show_form(
+            step_id="reauth_confirm",
+            data_schema=STEP_REAUTH_DATA_SCHEMA,
+            description_placeholders={"username": self._reauth_entry.data["username"]},
+            errors=errors,
+        )
@@ -1,3 +1,8 @@
 """Constants for the Hildebrand Glow (DCC) integration."""
 
 DOMAIN = "hildebrandglow_dcc"
+
+# Seconds to wait for the API to authenticate
+AUTH_TIMEOUT = 30
+# Seconds to wait for the API to respond to each request
+REQUEST_TIMEOUT = 20
@@ -1,12 +1,11 @@
 """Platform for sensor integration."""
 from __future__ import annotations
 
-from collections.abc import Callable
-from datetime import datetime, time, timedelta
+import asyncio
+from collections.abc import Callable, Coroutine
+from datetime import datetime, timedelta
 import logging
 
-import requests
-
 from homeassistant.components.sensor import (
     SensorDeviceClass,
     SensorEntity,
@@ -21,10 +20,29 @@ from homeassistant.helpers.update_coordinator import (
     DataUpdateCoordinator,
 )
 
+from .api import TokenRefresher, log_request_error
 from .const import DOMAIN
 
 _LOGGER = logging.getLogger(__name__)
-SCAN_INTERVAL = timedelta(minutes=5)
+TARIFF_SCAN_INTERVAL = timedelta(hours=1)
+# Limit parallel API requests so large accounts don't flood the executor or the Glow API
+MAX_CONCURRENT_REQUESTS = 3
+# Classifiers of the resources that measure consumption, as opposed to cost
+METER_CLASSIFIERS = frozenset({"electricity.consumption", "gas.consumption"})
+# Classifiers of the cost resources, mapped to the classifier of their meter
+COST_CLASSIFIERS = {
+    "electricity.consumption.cost": "electricity.consumption",
+    "gas.consumption.cost": "gas.consumption",
+}
+# Supply types of the known classifiers
+SUPPLY_BY_CLASSIFIER = {
+    "electricity.consumption": "electricity",
+    "electricity.consumption.cost": "electricity",
+    "gas.consumption": "gas",
+    "gas.consumption.cost": "gas",
+}
+# Seconds to wait before asking again for the tariff of a meter that has none
+NO_TARIFF_RETRY = 24 * 60 * 60
 
 
 async def async_setup_entry(
@@ -32,10 +50,10 @@ async def async_setup_entry(
 ) -> bool:
     """Set up the sensor platform."""
     entities: list = []
-    meters: dict = {}
 
     # Get API object from the config flow
-    glowmarkt = hass.data[DOMAIN][entry.entry_id]
+    refresher: TokenRefresher = hass.data[DOMAIN][entry.entry_id]
+    glowmarkt = refresher.client
 
     # Gather all virtual entities on the account
     virtual_entities: dict = {}
@@ -44,79 +62,115 @@ async def async_setup_entry(
             glowmarkt.get_virtual_entities
         )
         _LOGGER.debug("Successful GET to %svirtualentity", glowmarkt.url)
-    except requests.Timeout as ex:
-        _LOGGER.error("Timeout: %s", ex)
-    except requests.exceptions.ConnectionError as ex:
-        _LOGGER.error("Cannot connect: %s", ex)
     # Can't use the RuntimeError exception from the library as it's not a subclass of Exception
     except Exception as ex:  # pylint: disable=broad-except
-        if "Request failed" in str(ex):
-            _LOGGER.error(
-                "Non-200 Status Code. The Glow API may be experiencing issues"
-            )
-        else:
-            _LOGGER.exception("Unexpected exception: %s. Please open an issue", ex)
+        log_request_error(_LOGGER, ex)
 
-    for virtual_entity in virtual_entities:
-        # Gather all resources for each virtual entity
-        resources: dict = {}
-        try:
-            resources = await hass.async_add_executor_job(virtual_entity.get_resources)
-            _LOGGER.debug(
-                "Successful GET to %svirtualentity/%s/resources",
-                glowmarkt.url,
-                virtual_entity.id,
-            )
-        except requests.Timeout as ex:
-            _LOGGER.error("Timeout: %s", ex)
-        except requests.exceptions.ConnectionError as ex:
-            _LOGGER.error("Cannot connect: %s", ex)
-        # Can't use the RuntimeError exception from the library as it's not a subclass of Exception
-        except Exception as ex:  # pylint: disable=broad-except
-            if "Request failed" in str(ex):
-                _LOGGER.error(
-                    "Non-200 Status Code. The Glow API may be experiencing issues"
-                )
-            else:
-                _LOGGER.exception("Unexpected exception: %s. Please open an issue", ex)
-
-        # Loop through all resources and create sensors
-        for resource in resources:
-            if resource.classifier in ["electricity.consumption", "gas.consumption"]:
-                usage_sensor = Usage(hass, resource, virtual_entity)
-                entities.append(usage_sensor)
-                # Save the usage sensor as a meter so that the cost sensor can reference it
-                meters[resource.classifier] = usage_sensor
-
-                # Standing and Rate sensors are handled by the coordinator
-                coordinator = TariffCoordinator(hass, resource)
-                standing_sensor = Standing(coordinator, resource, virtual_entity)
-                entities.append(standing_sensor)
-                rate_sensor = Rate(coordinator, resource, virtual_entity)
-                entities.append(rate_sensor)
-
-        # Cost sensors must be created after usage sensors as they reference them as a meter
-        for resource in resources:
-            if resource.classifier == "gas.consumption.cost":
-                cost_sensor = Cost(hass, resource, virtual_entity)
-                cost_sensor.meter = meters["gas.consumption"]
-                entities.append(cost_sensor)
-            elif resource.classifier == "electricity.consumption.cost":
-                cost_sensor = Cost(hass, resource, virtual_entity)
-                cost_sensor.meter = meters["electricity.consumption"]
-                entities.append(cost_sensor)
-
-    # Get data for all entities on initial startup
-    async_add_entities(entities, update_before_add=True)
+    async def get_resources(virtual_entity):
+        return await hass.async_add_executor_job(virtual_entity.get_resources)
+
+    # Gather all resources for each virtual entity concurrently
+    results = await gather_limited(
+        MAX_CONCURRENT_REQUESTS,
+        *(get_resources(virtual_entity) for virtual_entity in virtual_entities),
+    )
+
+    for virtual_entity, resources in zip(virtual_entities, results):
+        if isinstance(resources, Exception):
+            log_request_error(_LOGGER, resources)
+            continue
+        _LOGGER.debug(
+            "Successful GET to %svirtualentity/%s/resources",
+            glowmarkt.url,
+            virtual_entity.id,
+        )
+
+        entities.extend(build_entities(hass, refresher, virtual_entity, resources))
+
+    # Get data for all entities on initial startup, refreshing each coordinator only once
+    # even when several sensors share it
+    coordinators = dict.fromkeys(entity.coordinator for entity in entities)
+    await gather_limited(
+        MAX_CONCURRENT_REQUESTS,
+        *(coordinator.async_refresh() for coordinator in coordinators),
+    )
+    async_add_entities(entities)
 
     return True
 
 
+async def gather_limited(limit: int, *coros: Coroutine) -> list:
+    """Run coroutines concurrently, at most limit at a time.
+
+    Exceptions are returned in place of results. The coroutines must not have
+    submitted any work before they are awaited, or the limit won't hold.
+    """
+    semaphore = asyncio.Semaphore(limit)
+
+    async def run(coro: Coroutine):
+        async with semaphore:
+            return await coro
+
+    return await asyncio.gather(*(run(coro) for coro in coros), return_exceptions=True)
+
+
+def build_entities(
+    hass: HomeAssistant, refresher: TokenRefresher, virtual_entity, resources
+) -> list:
+    """Create the sensors for the resources of a virtual entity."""
+    entities: list = []
+    meters: dict = {}
+
+    # Loop through all resources once and create sensors
+    costs = []
+    for resource in resources:
+        if resource.classifier in METER_CLASSIFIERS:
+            # Usage sensors are handled by their own coordinator
+            usage_coordinator = UsageCoordinator(hass, refresher, resource)
+            usage_sensor = Usage(usage_coordinator, resource, virtual_entity)
+            entities.append(usage_sensor)
+            # Save the usage sensor as a meter so that the cost sensor can reference it
+            meters[resource.classifier] = usage_sensor
+
+            # Standing and Rate sensors are handled by the coordinator
+            coordinator = TariffCoordinator(hass, refresher, resource)
+            standing_sensor = Standing(coordinator, resource, virtual_entity)
+            entities.append(standing_sensor)
+            rate_sensor = Rate(coordinator, resource, virtual_entity)
+            entities.append(rate_sensor)
+        elif resource.classifier in COST_CLASSIFIERS:
+            costs.append(resource)
+
+    # Cost sensors must be created after usage sensors as they reference them as a meter
+    for resource in costs:
+        meter = meters.get(COST_CLASSIFIERS[resource.classifier])
+        if meter is None:
+            _LOGGER.error(
+                "No usage resource found for cost resource %s (id: %s). Please open an issue",
+                resource.classifier,
+                resource.id,
+            )
+            continue
+        cost_sensor = Cost(
+            UsageCoordinator(hass, refresher, resource),
+            resource,
+            virtual_entity,
+            meter,
+        )
+        entities.append(cost_sensor)
+
+    return entities
+
+
 def supply_type(resource) -> str:
     """Return supply type."""
-    if "electricity.consumption" in resource.classifier:
+    supply = SUPPLY_BY_CLASSIFIER.get(resource.classifier)
+    if supply is not None:
+        return supply
+    # Fall back to the prefix for classifiers that aren't in the table
+    if resource.classifier.startswith("electricity.consumption"):
         return "electricity"
-    if "gas.consumption" in resource.classifier:
+    if resource.classifier.startswith("gas.consumption"):
         return "gas"
     _LOGGER.error("Unknown classifier: %s. Please open an issue", resource.classifier)
     return "unknown"
@@ -133,54 +187,59 @@ def device_name(resource, virtual_entity) -> str:
     return name
 
 
-async def should_update() -> bool:
+def device_info(resource, virtual_entity) -> DeviceInfo:
+    """Return device information for the meter of a resource."""
+    return DeviceInfo(
+        identifiers={(DOMAIN, resource.id)},
+        manufacturer="Hildebrand",
+        model="Glow (DCC)",
+        name=device_name(resource, virtual_entity),
+    )
+
+
+def should_update(now: datetime) -> bool:
     """Check if time is between 0-5 or 30-35 minutes past the hour."""
-    minutes = datetime.now().minute
-    if (0 <= minutes <= 5) or (30 <= minutes <= 35):
-        return True
-    return False
+    minutes = now.minute
+    return minutes <= 5 or 30 <= minutes <= 35
 
 
-async def daily_data(hass: HomeAssistant, resource) -> float:
-    """Get daily usage from the API."""
-    # If it's before 01:06, we need to fetch yesterday's data
-    # Should only need to be before 00:36 but gas data can be 30 minutes behind electricity data
-    if datetime.now().time() <= time(1, 5):
-        _LOGGER.debug("Fetching yesterday's data")
-        now = datetime.now() - timedelta(days=1)
-    else:
-        now = datetime.now()
-    # Round to the day to set time to 00:00:00
-    t_from = await hass.async_add_executor_job(resource.round, now, "P1D")
-    # Round to the minute
-    t_to = await hass.async_add_executor_job(resource.round, now, "PT1M")
+def fetch_readings(resource, t_from: datetime, t_to: datetime) -> list:
+    """Pull the latest DCC data and get the daily readings.
 
+    Both requests are blocking, so they run together in a single executor job.
+    """
     # Tell Hildebrand to pull latest DCC data
     try:
-        await hass.async_add_executor_job(resource.catchup)
+        resource.catchup()
         _LOGGER.debug(
-            "Successful GET to https://api.glowmarkt.com/api/v0-1/resource/%s/catchup",
-            resource.id,
+            "Successful GET to %sresource/%s/catchup", resource.client.url, resource.id
         )
-    except requests.Timeout as ex:
-        _LOGGER.error("Timeout: %s", ex)
-    except requests.exceptions.ConnectionError as ex:
-        _LOGGER.error("Cannot connect: %s", ex)
     # Can't use the RuntimeError exception from the library as it's not a subclass of Exception
     except Exception as ex:  # pylint: disable=broad-except
-        if "Request failed" in str(ex):
-            _LOGGER.warning(
-                "Non-200 Status Code. The Glow API may be experiencing issues"
-            )
-        else:
-            _LOGGER.exception("Unexpected exception: %s. Please open an issue", ex)
+        log_request_error(_LOGGER, ex, warn=True)
+
+    _LOGGER.debug(
+        "Get readings from %s to %s for %s", t_from, t_to, resource.classifier
+    )
+    return resource.get_readings(t_from, t_to, "P1D", "sum", True)
+
+
+async def daily_data(hass: HomeAssistant, resource, now: datetime) -> float:
+    """Get daily usage from the API."""
+    # If it's before 01:06, we need to fetch yesterday's data
+    # Should only need to be before 00:36 but gas data can be 30 minutes behind electricity data
+    if (now.hour, now.minute) <= (1, 5):
+        _LOGGER.debug("Fetching yesterday's data")
+        now -= timedelta(days=1)
+    # Rounding is plain datetime arithmetic with no I/O, so it doesn't need the executor
+    # Round to the day to set time to 00:00:00
+    t_from = resource.round(now, "P1D")
+    # Round to the minute
+    t_to = resource.round(now, "PT1M")
 
     try:
-        _LOGGER.debug(
-            "Get readings from %s to %s for %s", t_from, t_to, resource.classifier
-        )
         readings = await hass.async_add_executor_job(
-            resource.get_readings, t_from, t_to, "P1D", "sum", True
+            fetch_readings, resource, t_from, t_to
         )
         _LOGGER.debug("Successfully got daily usage for resource id %s", resource.id)
         _LOGGER.debug(
@@ -190,152 +249,142 @@ async def daily_data(hass: HomeAssistant, resource) -> float:
         if len(readings) > 1:
             v += readings[1][1].value
         return v
-    except requests.Timeout as ex:
-        _LOGGER.error("Timeout: %s", ex)
-    except requests.exceptions.ConnectionError as ex:
-        _LOGGER.error("Cannot connect: %s", ex)
     # Can't use the RuntimeError exception from the library as it's not a subclass of Exception
     except Exception as ex:  # pylint: disable=broad-except
-        if "Request failed" in str(ex):
-            _LOGGER.warning(
-                "Non-200 Status Code. The Glow API may be experiencing issues"
-            )
-        else:
-            _LOGGER.exception("Unexpected exception: %s. Please open an issue", ex)
+        log_request_error(_LOGGER, ex, warn=True)
     return None
 
 
-async def tariff_data(hass: HomeAssistant, resource) -> float:
-    """Get tariff data from the API."""
-    try:
-        tariff = await hass.async_add_executor_job(resource.get_tariff)
-        _LOGGER.debug(
-            "Successful GET to https://api.glowmarkt.com/api/v0-1/resource/%s/tariff",
-            resource.id,
-        )
-        return tariff
-    except UnboundLocalError:
-        supply = supply_type(resource)
-        _LOGGER.warning(
-            "No tariff data found for %s meter (id: %s). If you don't see tariff data for this meter in the Bright app, please disable the associated rate and standing charge sensors",
-            supply,
-            resource.id,
+class UsageCoordinator(DataUpdateCoordinator):
+    """Data update coordinator for the usage and cost sensors."""
+
+    def __init__(
+        self, hass: HomeAssistant, refresher: TokenRefresher, resource
+    ) -> None:
+        """Initialize usage coordinator."""
+        super().__init__(
+            hass,
+            _LOGGER,
+            # Name of the data. For logging purposes.
+            name="usage",
+            # Polling interval. Will only be polled if there are subscribers.
+            update_interval=timedelta(minutes=5),
         )
-    except requests.Timeout as ex:
-        _LOGGER.error("Timeout: %s", ex)
-    except requests.exceptions.ConnectionError as ex:
-        _LOGGER.error("Cannot connect: %s", ex)
-    # Can't use the RuntimeError exception from the library as it's not a subclass of Exception
-    except Exception as ex:  # pylint: disable=broad-except
-        if "Request failed" in str(ex):
-            _LOGGER.warning(
-                "Non-200 Status Code. The Glow API may be experiencing issues"
-            )
-        else:
-            _LOGGER.exception("Unexpected exception: %s. Please open an issue", ex)
-    return None
+
+        self.initialised = False
+        self.refresher = refresher
+        self.resource = resource
+
+    async def _async_update_data(self):
+        """Fetch data from readings API endpoint."""
+        # Read the clock once per update and share it with the helpers
+        now = datetime.now()
+        # Get data on initial startup, then only poll when updated data might be available
+        if self.initialised and not should_update(now):
+            return self.data
+        await self.refresher.async_refresh(_LOGGER)
+        value = await daily_data(self.hass, self.resource, now)
+        if value:
+            self.initialised = True
+        return value
+
+
+class GlowSensor(CoordinatorEntity, SensorEntity):
+    """Sensor whose value is converted from the data of its coordinator."""
+
+    _attr_has_entity_name = True
+
+    # Value and availability last written to the state machine
+    _written_state: tuple | None = None
+
+    async def async_added_to_hass(self) -> None:
+        """Subscribe to the coordinator and use the data fetched before adding."""
+        await super().async_added_to_hass()
+        # Home Assistant writes the state straight after this, so only set the value
+        self._update_native_value()
+        self._written_state = self._current_state()
+
+    def _native_value(self, data):
+        """Return the value of the sensor from the data of its coordinator."""
+        return round(data, 2)
+
+    @callback
+    def _update_native_value(self) -> None:
+        """Set the value of the sensor if the coordinator has data."""
+        if self.coordinator.data:
+            self._attr_native_value = self._native_value(self.coordinator.data)
+
+    def _current_state(self) -> tuple:
+        """Return the value and availability that would be written."""
+        return (self._attr_native_value, self.coordinator.last_update_success)
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        self._update_native_value()
+        # Most polls outside the update windows return the same value, so skip the
+        # write unless the value or the availability of the sensor has changed
+        state = self._current_state()
+        if state == self._written_state:
+            return
+        self._written_state = state
+        self.async_write_ha_state()
 
 
-class Usage(SensorEntity):
+class Usage(GlowSensor):
     """Sensor object for daily usage."""
 
     _attr_device_class = SensorDeviceClass.ENERGY
-    _attr_has_entity_name = True
     _attr_name = "Usage (today)"
     _attr_native_unit_of_measurement = UnitOfEnergy.KILO_WATT_HOUR
     _attr_state_class = SensorStateClass.TOTAL_INCREASING
 
-    def __init__(self, hass: HomeAssistant, resource, virtual_entity) -> None:
+    def __init__(self, coordinator, resource, virtual_entity) -> None:
         """Initialize the sensor."""
+        super().__init__(coordinator)
+
         self._attr_unique_id = resource.id
+        # Device information never changes, so only build it once
+        self._attr_device_info = device_info(resource, virtual_entity)
+        # Only the gas usage sensor needs an icon as the others inherit from their device class
+        if resource.classifier == "gas.consumption":
+            self._attr_icon = "mdi:fire"
 
-        self.hass = hass
-        self.initialised = False
         self.resource = resource
         self.virtual_entity = virtual_entity
 
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device information."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, self.resource.id)},
-            manufacturer="Hildebrand",
-            model="Glow (DCC)",
-            name=device_name(self.resource, self.virtual_entity),
-        )
 
-    @property
-    def icon(self) -> str | None:
-        """Icon to use in the frontend."""
-        # Only the gas usage sensor needs an icon as the others inherit from their device class
-        if self.resource.classifier == "gas.consumption":
-            return "mdi:fire"
-
-    async def async_update(self) -> None:
-        """Fetch new data for the sensor."""
-        # Get data on initial startup
-        if not self.initialised:
-            value = await daily_data(self.hass, self.resource)
-            if value:
-                self._attr_native_value = round(value, 2)
-                self.initialised = True
-        else:
-            # Only update the sensor if it's between 0-5 or 30-35 minutes past the hour
-            if await should_update():
-                value = await daily_data(self.hass, self.resource)
-                if value:
-                    self._attr_native_value = round(value, 2)
-
-
-class Cost(SensorEntity):
+class Cost(GlowSensor):
     """Sensor usage for daily cost."""
 
     _attr_device_class = SensorDeviceClass.MONETARY
-    _attr_has_entity_name = True
     _attr_name = "Cost (today)"
     _attr_native_unit_of_measurement = "GBP"
     _attr_state_class = SensorStateClass.TOTAL_INCREASING
 
-    def __init__(self, hass: HomeAssistant, resource, virtual_entity) -> None:
+    def __init__(self, coordinator, resource, virtual_entity, meter: Usage) -> None:
         """Initialize the sensor."""
+        super().__init__(coordinator)
+
         self._attr_unique_id = resource.id
+        # Get the identifier from the meter so that the cost sensors have the same device
+        self._attr_device_info = device_info(meter.resource, virtual_entity)
 
-        self.hass = hass
-        self.initialised = False
-        self.meter = None
+        self.meter = meter
         self.resource = resource
         self.virtual_entity = virtual_entity
 
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device information."""
-        return DeviceInfo(
-            # Get the identifier from the meter so that the cost sensors have the same device
-            identifiers={(DOMAIN, self.meter.resource.id)},
-            manufacturer="Hildebrand",
-            model="Glow (DCC)",
-            name=device_name(self.resource, self.virtual_entity),
-        )
-
-    async def async_update(self) -> None:
-        """Fetch new data for the sensor."""
-        if not self.initialised:
-            value = await daily_data(self.hass, self.resource)
-            if value:
-                self._attr_native_value = round(value / 100, 2)
-                self.initialised = True
-        else:
-            # Only update the sensor if it's between 0-5 or 30-35 minutes past the hour
-            if await should_update():
-                value = await daily_data(self.hass, self.resource)
-                if value:
-                    self._attr_native_value = round(value / 100, 2)
+    def _native_value(self, data):
+        """Return the cost in pounds from the cost in pence."""
+        return round(data / 100, 2)
 
 
 class TariffCoordinator(DataUpdateCoordinator):
     """Data update coordinator for the tariff sensors."""
 
-    def __init__(self, hass: HomeAssistant, resource) -> None:
+    def __init__(
+        self, hass: HomeAssistant, refresher: TokenRefresher, resource
+    ) -> None:
         """Initialize tariff coordinator."""
         super().__init__(
             hass,
@@ -343,30 +392,48 @@ class TariffCoordinator(DataUpdateCoordinator):
             # Name of the data. For logging purposes.
             name="tariff",
             # Polling interval. Will only be polled if there are subscribers.
-            update_interval=timedelta(minutes=5),
+            # Tariffs change at most daily, so there's no need to follow the usage windows
+            update_interval=TARIFF_SCAN_INTERVAL,
         )
 
-        self.rate_initialised = False
-        self.standing_initialised = False
+        self.refresher = refresher
         self.resource = resource
+        # When to next ask for the tariff of a meter that has none
+        self.retry_after = 0.0
 
     async def _async_update_data(self):
         """Fetch data from tariff API endpoint."""
-        # This needs 2 loops to ensure both the rate and the standing sensors get initial values
-        if not self.standing_initialised:
-            if not self.rate_initialised:
-                self.rate_initialised = True
-                return await tariff_data(self.hass, self.resource)
-            self.standing_initialised = True
-            return await tariff_data(self.hass, self.resource)
-        # Only poll when updated data might be available
-        if await should_update():
-            tariff = await tariff_data(self.hass, self.resource)
+        # Meters without tariff data won't gain it within the day, so don't keep asking
+        now = datetime.now().timestamp()
+        if now < self.retry_after:
+            return None
+
+        await self.refresher.async_refresh(_LOGGER)
+
+        try:
+            tariff = await self.hass.async_add_executor_job(self.resource.get_tariff)
+            _LOGGER.debug(
+                "Successful GET to %sresource/%s/tariff",
+                self.resource.client.url,
+                self.resource.id,
+            )
             return tariff
+        except UnboundLocalError:
+            supply = supply_type(self.resource)
+            _LOGGER.warning(
+                "No tariff data found for %s meter (id: %s). If you don't see tariff data for this meter in the Bright app, please disable the associated rate and standing charge sensors",
+                supply,
+                self.resource.id,
+            )
+            self.retry_after = now + NO_TARIFF_RETRY
+        # Can't use the RuntimeError exception from the library as it's not a subclass of Exception
+        except Exception as ex:  # pylint: disable=broad-except
+            log_request_error(_LOGGER, ex, warn=True)
+        return None
 
 
-class Standing(CoordinatorEntity, SensorEntity):
-    """An entity using CoordinatorEntity.
+class TariffSensor(GlowSensor):
+    """An entity using CoordinatorEntity for a part of the tariff.
 
     The CoordinatorEntity class provides:
       should_poll
@@ -376,89 +443,48 @@ class Standing(CoordinatorEntity, SensorEntity):
 
     """
 
-    _attr_device_class = SensorDeviceClass.MONETARY
-    _attr_has_entity_name = True
-    _attr_name = "Standing charge"
-    _attr_native_unit_of_measurement = "GBP"
     _attr_entity_registry_enabled_default = (
         False  # Don't enable by default as less commonly used
     )
+    # Appended to the resource ID to make the unique ID of each tariff sensor
+    _unique_suffix: str
+    # Field of the tariff's current_rates that holds the value in pence
+    _rate_field: str
 
     def __init__(self, coordinator, resource, virtual_entity) -> None:
         """Pass coordinator to CoordinatorEntity."""
         super().__init__(coordinator)
 
-        self._attr_unique_id = resource.id + "-tariff"
+        self._attr_unique_id = f"{resource.id}{self._unique_suffix}"
+        self._attr_device_info = device_info(resource, virtual_entity)
 
         self.resource = resource
         self.virtual_entity = virtual_entity
 
-    @callback
-    def _handle_coordinator_update(self) -> None:
-        """Handle updated data from the coordinator."""
-        if self.coordinator.data:
-            value = (
-                float(self.coordinator.data.current_rates.standing_charge.value) / 100
-            )
-            self._attr_native_value = round(value, 4)
-            self.async_write_ha_state()
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device information."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, self.resource.id)},
-            manufacturer="Hildebrand",
-            model="Glow (DCC)",
-            name=device_name(self.resource, self.virtual_entity),
-        )
+    def _native_value(self, data):
+        """Return the value in pounds from the rate in pence."""
+        pence = getattr(data.current_rates, self._rate_field).value
+        return round(float(pence) / 100, 4)
 
 
-class Rate(CoordinatorEntity, SensorEntity):
-    """An entity using CoordinatorEntity.
+class Standing(TariffSensor):
+    """Sensor for the daily standing charge."""
 
-    The CoordinatorEntity class provides:
-      should_poll
-      async_update
-      async_added_to_hass
-      available
+    _attr_device_class = SensorDeviceClass.MONETARY
+    _attr_name = "Standing charge"
+    _attr_native_unit_of_measurement = "GBP"
+    _unique_suffix = "-tariff"
+    _rate_field = "standing_charge"
 
-    """
+
+class Rate(TariffSensor):
+    """Sensor for the unit rate."""
 
     _attr_device_class = None
-    _attr_has_entity_name = True
     _attr_icon = (
         "mdi:cash-multiple"  # Need to provide an icon as doesn't have a device class
     )
     _attr_name = "Rate"
     _attr_native_unit_of_measurement = "GBP/kWh"
-    _attr_entity_registry_enabled_default = (
-        False  # Don't enable by default as less commonly used
-    )
-
-    def __init__(self, coordinator, resource, virtual_entity) -> None:
-        """Pass coordinator to CoordinatorEntity."""
-        super().__init__(coordinator)
-
-        self._attr_unique_id = resource.id + "-rate"
-
-        self.resource = resource
-        self.virtual_entity = virtual_entity
-
-    @callback
-    def _handle_coordinator_update(self) -> None:
-        """Handle updated data from the coordinator."""
-        if self.coordinator.data:
-            value = float(self.coordinator.data.current_rates.rate.value) / 100
-            self._attr_native_value = round(value, 4)
-            self.async_write_ha_state()
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device information."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, self.resource.id)},
-            manufacturer="Hildebrand",
-            model="Glow (DCC)",
-            name=device_name(self.resource, self.virtual_entity),
-        )
+    _unique_suffix = "-rate"
+    _rate_field = "rate"